@@ -0,0 +1,206 @@
+"""
+Structure-of-arrays circular buffer that stores parsed message fields in
+typed array.array columns instead of Message objects.
+"""
+from array import array
+from cyclic_buffer import BufferOverflowError, BufferUnderflowError, _storage_size
+from message import Message, TelemetryMessage, LocationMessage, SettingsMessage
+from message_factory import MessageFactory, InvalidMessageError
+
+
+# Discriminator values stored in the "type" column, one per message class
+# that has columns in this layout
+_TEL_CODE, _GPS_CODE, _SET_CODE = 0, 1, 2
+_CLASS_CODES = {TelemetryMessage: _TEL_CODE, LocationMessage: _GPS_CODE, SettingsMessage: _SET_CODE}
+
+# Message type string -> discriminator, for the supported types in MESSAGE_TYPES
+TYPE_CODES = {
+    msg_type: _CLASS_CODES[cls]
+    for msg_type, cls in MessageFactory.MESSAGE_TYPES.items() if cls in _CLASS_CODES
+}
+
+
+class ColumnarCyclicBuffer:
+    """
+    Circular buffer keeping one typed array.array column per message field.
+    
+    Messages are parsed straight into the row at the head position, so no
+    Message object is allocated until pop() materializes one. Columns that
+    do not apply to a row's type hold zero; filter with the "type" column.
+    
+    Columns store raw C values (no per-row Python objects) and are exposed
+    through the buffer protocol, so np.asarray(buffer.view(field)) wraps
+    them without copying when NumPy is available.
+    
+    Columns (array.array typecode):
+    - type: 'B' uint8 (see TYPE_CODES)
+    - sensor_id: 'H' uint16
+    - battery: 'B' uint8 (TEL)
+    - longitude, latitude: 'd' float64 (GPS)
+    - on_off: 'B' 0/1, rate: 'H' uint16 (SET)
+    """
+    
+    FIELDS = {
+        "type": "B",
+        "sensor_id": "H",
+        "battery": "B",
+        "longitude": "d",
+        "latitude": "d",
+        "on_off": "B",
+        "rate": "H",
+    }
+    
+    def __init__(self, capacity: int, overwrite: bool = False):
+        """
+        Initialize columnar buffer.
+        
+        Args:
+            capacity: Maximum number of messages (1-100)
+            overwrite: If True, overwrite oldest message when full
+        
+        Raises:
+            ValueError: If capacity < 1 or capacity > 100
+        """
+        if not (1 <= capacity <= 100):
+            raise ValueError(f"Capacity must be between 1 and 100, got {capacity}")
+        
+        self._capacity = capacity
+        self._overwrite = overwrite
+        storage = _storage_size(capacity)
+        self._columns = {name: array(typecode, [0]) * storage for name, typecode in self.FIELDS.items()}
+        self._mask = storage - 1
+        self._head = 0  # Row to write next message
+        self._tail = 0  # Row to read next message
+        self._size = 0  # Current number of messages
+    
+    def push_parsed(self, msg_string: str) -> bool:
+        """
+        Parse a message string directly into the next row.
+        
+        Args:
+            msg_string: Fixed-format message string
+        
+        Returns:
+            True if successful
+        
+        Raises:
+            InvalidMessageError: If message format is invalid or its type has
+                no columns in this layout
+            BufferOverflowError: If buffer is full and overwrite is False
+        """
+        sensor_id, msg_type, data = MessageFactory.split_message(msg_string)
+        message_class = MessageFactory.MESSAGE_TYPES.get(msg_type)
+        if message_class is None:
+            raise MessageFactory._unknown_type_error(msg_type)
+        code = _CLASS_CODES.get(message_class)
+        if code is None:
+            raise InvalidMessageError(
+                f"Message type '{msg_type}' ({message_class.__name__}) is not supported "
+                f"by the columnar layout"
+            )
+        try:
+            fields = message_class.parse_fields(data)
+        except ValueError as e:
+            raise InvalidMessageError(f"Failed to parse {msg_type} message data: {e}")
+        
+        if self._size == self._capacity:
+            if not self._overwrite:
+                raise BufferOverflowError("Buffer is full and overwrite is disabled")
+            # Overwrite mode: discard oldest row
+            self._tail = (self._tail + 1) & self._mask
+            self._size -= 1
+        
+        row = self._head
+        columns = self._columns
+        columns["type"][row] = code
+        columns["sensor_id"][row] = sensor_id
+        columns["battery"][row] = 0
+        columns["longitude"][row] = 0.0
+        columns["latitude"][row] = 0.0
+        columns["on_off"][row] = 0
+        columns["rate"][row] = 0
+        if code == _TEL_CODE:
+            columns["battery"][row] = fields[0]
+        elif code == _GPS_CODE:
+            columns["longitude"][row], columns["latitude"][row] = fields
+        else:  # _SET_CODE
+            columns["on_off"][row], columns["rate"][row] = fields
+        
+        self._head = (row + 1) & self._mask
+        self._size += 1
+        return True
+    
+    def pop(self) -> Message:
+        """
+        Remove the oldest row and return it as a Message object (FIFO).
+        
+        Raises:
+            BufferUnderflowError: If buffer is empty
+        """
+        if self._size == 0:
+            raise BufferUnderflowError("Buffer is empty")
+        
+        row = self._tail
+        columns = self._columns
+        code = columns["type"][row]
+        sensor_id = columns["sensor_id"][row]
+        if code == _TEL_CODE:
+            message = TelemetryMessage(sensor_id)
+            message.battery_status = columns["battery"][row]
+        elif code == _GPS_CODE:
+            message = LocationMessage(sensor_id)
+            message.longitude = columns["longitude"][row]
+            message.latitude = columns["latitude"][row]
+        else:
+            message = SettingsMessage(sensor_id)
+            message.on_off = bool(columns["on_off"][row])
+            message.msgs_per_second = columns["rate"][row]
+        
+        self._tail = (row + 1) & self._mask
+        self._size -= 1
+        return message
+    
+    def view(self, field: str) -> memoryview:
+        """
+        Return the live rows of one column, oldest first.
+        
+        The result is a read-only memoryview over the column without copying,
+        unless the live rows wrap around the end of storage, in which case
+        the two parts are copied into one array first.
+        
+        Args:
+            field: Column name (see FIELDS)
+        
+        Raises:
+            KeyError: If field is not a known column
+        """
+        column = self._columns[field]
+        end = self._tail + self._size
+        if end <= len(column):
+            return memoryview(column)[self._tail:end].toreadonly()
+        return memoryview(column[self._tail:] + column[:end - len(column)]).toreadonly()
+    
+    def get_size(self) -> int:
+        """Return current number of messages in buffer."""
+        return self._size
+    
+    def get_max_size(self) -> int:
+        """Return maximum capacity of buffer."""
+        return self._capacity
+    
+    def is_empty(self) -> bool:
+        """Check if buffer is empty."""
+        return self._size == 0
+    
+    def is_full(self) -> bool:
+        """Check if buffer is full."""
+        return self._size == self._capacity
+    
+    def __str__(self):
+        """String representation of buffer state."""
+        return (f"ColumnarCyclicBuffer(size={self._size}/{self._capacity}, "
+                f"overwrite={self._overwrite})")
+    
+    def __len__(self):
+        """Return current size (enables len(buffer))."""
+        return self._size
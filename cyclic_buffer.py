@@ -1,10 +1,23 @@
 """
 Circular buffer implementation for Message objects with FIFO behavior.
 """
-from typing import Optional
+import logging
+from collections import deque
+from itertools import islice
+from typing import Callable, Iterable, List, Optional, Tuple, TypeVar
 from message import Message
 
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Status flag bits packed into CyclicBuffer._flags
+_OVERFLOW = 1
+_UNDERFLOW = 2
+_DATA_LOSS_RESIZE = 4
+
+
 class BufferOverflowError(Exception):
     """Exception raised when pushing to a full buffer without overwrite enabled."""
     pass
@@ -15,6 +28,11 @@ class BufferUnderflowError(Exception):
     pass
 
 
+def _storage_size(capacity: int) -> int:
+    """Return the smallest power of two that can hold capacity messages."""
+    return 1 << (capacity - 1).bit_length()
+
+
 class CyclicBuffer:
     """
     Fixed-capacity circular buffer implementing FIFO behavior for Message objects.
@@ -24,8 +42,18 @@ class CyclicBuffer:
     - Overflow and underflow protection with flag management
     - Dynamic capacity resizing
     - O(1) push/pop operations
+    
+    Without overwrite, messages live in a list whose length is rounded up to
+    a power of two so index wrap-around is a bitmask instead of a modulo;
+    capacity limits remain user-defined. With overwrite, messages live in a
+    collections.deque(maxlen=capacity), which discards the oldest entry on
+    append entirely in C.
     """
     
+    __slots__ = (
+        "_capacity", "_overwrite", "_buffer", "_mask", "_head", "_tail", "_size", "_flags",
+    )
+    
     def __init__(self, capacity: int, overwrite: bool = False):
         """
         Initialize circular buffer.
@@ -42,15 +70,56 @@ class CyclicBuffer:
         
         self._capacity = capacity
         self._overwrite = overwrite
-        self._buffer = [None] * capacity
+        if overwrite:
+            self._buffer = deque(maxlen=capacity)
+            self._mask = 0  # Unused: deque handles wrap-around
+        else:
+            self._buffer = [None] * _storage_size(capacity)
+            self._mask = len(self._buffer) - 1
         self._head = 0  # Position to write next element
         self._tail = 0  # Position to read next element
         self._size = 0  # Current number of elements
         
-        # Status flags
-        self._overflow_flag = False
-        self._underflow_flag = False
-        self._data_loss_resize_flag = False
+        # Sticky status flags as bits (_OVERFLOW, _UNDERFLOW, _DATA_LOSS_RESIZE)
+        self._flags = 0
+    
+    @classmethod
+    def from_prealloc(cls, storage: list, capacity: int) -> "CyclicBuffer":
+        """
+        Create a non-overwriting buffer that adopts caller-allocated storage.
+        
+        The list is used as the ring in place (it is cleared to None), so
+        callers can keep one allocation and reuse it across buffers.
+        
+        Args:
+            storage: List whose length is a power of two and >= capacity
+            capacity: Maximum number of messages (1-100)
+            
+        Returns:
+            New CyclicBuffer with overwrite disabled
+            
+        Raises:
+            ValueError: If capacity is out of range or storage has an invalid length
+        """
+        if not (1 <= capacity <= 100):
+            raise ValueError(f"Capacity must be between 1 and 100, got {capacity}")
+        length = len(storage)
+        if length < capacity or length & (length - 1):
+            raise ValueError(
+                f"Storage length must be a power of two >= capacity ({capacity}), got {length}"
+            )
+        
+        buffer = cls.__new__(cls)
+        buffer._capacity = capacity
+        buffer._overwrite = False
+        storage[:] = [None] * length
+        buffer._buffer = storage
+        buffer._mask = length - 1
+        buffer._head = 0
+        buffer._tail = 0
+        buffer._size = 0
+        buffer._flags = 0
+        return buffer
     
     def push(self, message: Message) -> bool:
         """
@@ -65,23 +134,30 @@ class CyclicBuffer:
         Raises:
             BufferOverflowError: If buffer is full and overwrite is False
         """
-        if self.is_full():
-            if not self._overwrite:
-                self._overflow_flag = True
-                print(f"Buffer overflow: Cannot push to full buffer (capacity={self._capacity})")
-                raise BufferOverflowError("Buffer is full and overwrite is disabled")
+        size = self._size
+        buf = self._buffer
+        if self._overwrite:
+            if size == self._capacity:
+                self._flags |= _OVERFLOW
+                logger.debug("Buffer overflow: Overwriting oldest message")
             else:
-                # Overwrite mode: remove oldest message
-                self._overflow_flag = True
-                print(f"Buffer overflow: Overwriting oldest message")
-                # Move tail forward to discard oldest
-                self._tail = (self._tail + 1) % self._capacity
-                self._size -= 1
+                self._size = size + 1
+            # deque(maxlen) drops the oldest message itself when full
+            buf.append(message)
+            return True
+        
+        if size == self._capacity:
+            self._flags |= _OVERFLOW
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Buffer overflow: Cannot push to full buffer (capacity=%d)",
+                             self._capacity)
+            raise BufferOverflowError("Buffer is full and overwrite is disabled")
         
         # Add message at head position
-        self._buffer[self._head] = message
-        self._head = (self._head + 1) % self._capacity
-        self._size += 1
+        head = self._head
+        buf[head] = message
+        self._head = (head + 1) & self._mask
+        self._size = size + 1
         
         return True
     
@@ -95,19 +171,276 @@ class CyclicBuffer:
         Raises:
             BufferUnderflowError: If buffer is empty
         """
-        if self.is_empty():
-            self._underflow_flag = True
-            print(f"Buffer underflow: Cannot pop from empty buffer")
+        size = self._size
+        if size == 0:
+            self._flags |= _UNDERFLOW
+            logger.debug("Buffer underflow: Cannot pop from empty buffer")
             raise BufferUnderflowError("Buffer is empty")
         
+        buf = self._buffer
+        if self._overwrite:
+            self._size = size - 1
+            return buf.popleft()
+        
         # Get message from tail position
-        message = self._buffer[self._tail]
-        self._buffer[self._tail] = None  # Clear reference
-        self._tail = (self._tail + 1) % self._capacity
-        self._size -= 1
+        tail = self._tail
+        message = buf[tail]
+        buf[tail] = None  # Clear reference
+        self._tail = (tail + 1) & self._mask
+        self._size = size - 1
         
         return message
     
+    def try_push(self, message: Message) -> bool:
+        """
+        Add message to buffer without raising when it is full.
+        
+        Sets the overflow flag exactly like push().
+        
+        Args:
+            message: Message object to add
+        
+        Returns:
+            True if pushed (or an old message was overwritten), False if full
+        """
+        if not self._overwrite and self._size == self._capacity:
+            self._flags |= _OVERFLOW
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Buffer overflow: Cannot push to full buffer (capacity=%d)",
+                             self._capacity)
+            return False
+        return self.push(message)
+    
+    def try_pop(self) -> Tuple[bool, Optional[Message]]:
+        """
+        Remove oldest message without raising when the buffer is empty.
+        
+        Sets the underflow flag exactly like pop().
+        
+        Returns:
+            (True, message) if a message was popped, (False, None) if empty
+        """
+        if self._size == 0:
+            self._flags |= _UNDERFLOW
+            logger.debug("Buffer underflow: Cannot pop from empty buffer")
+            return False, None
+        return True, self.pop()
+    
+    def pusher(self) -> Callable[[Message], bool]:
+        """
+        Return the bound push method for hot loops.
+        
+        Binding once (p = buffer.pusher(); for m in msgs: p(m)) avoids a
+        method lookup per iteration. Prefer push_many() when the messages
+        are already collected.
+        """
+        return self.push
+    
+    def popper(self) -> Callable[[], Message]:
+        """Return the bound pop method for hot loops (see pusher())."""
+        return self.pop
+    
+    def pop_and_release(self, consumer: Callable[[Message], T]) -> T:
+        """
+        Pop the oldest message, hand it to consumer, then return it to its pool.
+        
+        The message is recycled by later MessageFactory calls, so consumer
+        must not keep a reference to it.
+        
+        Args:
+            consumer: Callable receiving the popped message
+            
+        Returns:
+            Value returned by consumer
+            
+        Raises:
+            BufferUnderflowError: If buffer is empty
+        """
+        message = self.pop()
+        try:
+            return consumer(message)
+        finally:
+            message.release()
+    
+    def push_many(self, messages: Iterable[Message]) -> int:
+        """
+        Add several messages to buffer (FIFO) with a single capacity check.
+        
+        Args:
+            messages: Message objects to add, oldest first
+            
+        Returns:
+            Number of messages pushed
+            
+        Raises:
+            BufferOverflowError: If messages do not fit and overwrite is False
+                (buffer is left unchanged)
+        """
+        if not isinstance(messages, (list, tuple)):
+            messages = list(messages)
+        count = len(messages)
+        if count == 0:
+            return 0
+        
+        capacity = self._capacity
+        free = capacity - self._size
+        if self._overwrite:
+            if count > free:
+                self._flags |= _OVERFLOW
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Buffer overflow: Overwriting %d oldest messages",
+                                 min(count - free, self._size))
+            self._buffer.extend(messages)
+            self._size = min(self._size + count, capacity)
+            return count
+        
+        if count > free:
+            self._flags |= _OVERFLOW
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Buffer overflow: Cannot push %d messages (free=%d)",
+                             count, free)
+            raise BufferOverflowError("Buffer is full and overwrite is disabled")
+        
+        # Write at head with at most two slice assignments
+        buf = self._buffer
+        head = self._head
+        first = min(count, len(buf) - head)
+        buf[head:head + first] = messages[:first]
+        if first < count:
+            buf[:count - first] = messages[first:]
+        self._head = (head + count) & self._mask
+        self._size += count
+        
+        return count
+    
+    def pop_many(self, count: int) -> List[Message]:
+        """
+        Remove and return the count oldest messages from buffer (FIFO).
+        
+        Args:
+            count: Number of messages to remove
+            
+        Returns:
+            List of Message objects, oldest first
+            
+        Raises:
+            ValueError: If count is negative
+            BufferUnderflowError: If buffer holds fewer than count messages
+                (buffer is left unchanged)
+        """
+        if count < 0:
+            raise ValueError(f"Count must be non-negative, got {count}")
+        if count > self._size:
+            self._flags |= _UNDERFLOW
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Buffer underflow: Cannot pop %d messages (size=%d)",
+                             count, self._size)
+            raise BufferUnderflowError("Buffer holds fewer messages than requested")
+        
+        if self._overwrite:
+            popleft = self._buffer.popleft
+            self._size -= count
+            return [popleft() for _ in range(count)]
+        
+        messages = [None] * count
+        self._copy_ordered(messages, self._tail, count)
+        self._discard_oldest(count)
+        
+        return messages
+    
+    def peek_view(self, count: Optional[int] = None) -> Tuple[List[Message], ...]:
+        """
+        Return the oldest messages without removing them.
+        
+        The result is one list, or two when the live region wraps around the
+        end of storage; together they hold the messages oldest first. The
+        lists are shallow slices, so no message is copied and the buffer is
+        not modified. Follow with advance() to consume what was read. For a
+        single message, pop() is cheaper.
+        
+        Args:
+            count: Number of messages to view (default: all)
+            
+        Returns:
+            Tuple of one or two lists of Message objects
+            
+        Raises:
+            ValueError: If count is negative
+        """
+        if count is not None and count < 0:
+            raise ValueError(f"Count must be non-negative, got {count}")
+        size = self._size
+        if count is None or count > size:
+            count = size
+        
+        if self._overwrite:
+            return (list(islice(self._buffer, count)),)
+        
+        buf = self._buffer
+        tail = self._tail
+        end = tail + count
+        if end <= len(buf):
+            return (buf[tail:end],)
+        return (buf[tail:], buf[:end - len(buf)])
+    
+    def advance(self, count: int):
+        """
+        Discard the count oldest messages, e.g. after reading them with peek_view().
+        
+        Args:
+            count: Number of messages to discard
+            
+        Raises:
+            ValueError: If count is negative
+            BufferUnderflowError: If buffer holds fewer than count messages
+        """
+        if count < 0:
+            raise ValueError(f"Count must be non-negative, got {count}")
+        if count > self._size:
+            self._flags |= _UNDERFLOW
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Buffer underflow: Cannot advance %d messages (size=%d)",
+                             count, self._size)
+            raise BufferUnderflowError("Buffer holds fewer messages than requested")
+        
+        if self._overwrite:
+            popleft = self._buffer.popleft
+            for _ in range(count):
+                popleft()
+            self._size -= count
+        else:
+            self._discard_oldest(count)
+    
+    def _discard_oldest(self, count: int):
+        """Drop count messages from the tail, clearing their slots."""
+        buf = self._buffer
+        tail = self._tail
+        end = tail + count
+        storage = len(buf)
+        if end <= storage:
+            buf[tail:end] = [None] * count
+        else:
+            buf[tail:] = [None] * (storage - tail)
+            buf[:end - storage] = [None] * (end - storage)
+        self._tail = end & self._mask
+        self._size -= count
+    
+    def clear(self):
+        """
+        Drop all messages and reset flags, reusing the existing storage.
+        
+        Capacity and overwrite mode are kept as they are.
+        """
+        buf = self._buffer
+        if self._overwrite:
+            buf.clear()
+        else:
+            buf[:] = [None] * len(buf)
+        self._head = 0
+        self._tail = 0
+        self._size = 0
+        self._flags = 0
+    
     def resize(self, new_capacity: int) -> bool:
         """
         Change buffer capacity at runtime.
@@ -140,13 +473,17 @@ class CyclicBuffer:
                 # Current size exceeds new capacity
                 if self._overwrite:
                     # Discard oldest messages
+                    discarded = self._size - new_capacity
                     self._shrink_with_data_loss(new_capacity)
-                    self._data_loss_resize_flag = True
-                    print(f"Resize with data loss: Discarded {self._size - new_capacity} messages")
+                    self._flags |= _DATA_LOSS_RESIZE
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning("Resize with data loss: Discarded %d messages", discarded)
                     return True
                 else:
                     # Reject resize
-                    print(f"Resize rejected: Would lose {self._size - new_capacity} messages (overwrite=False)")
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning("Resize rejected: Would lose %d messages (overwrite=False)",
+                                       self._size - new_capacity)
                     return False
         
         # Case 3: Same capacity - no-op
@@ -154,50 +491,63 @@ class CyclicBuffer:
     
     def _expand_buffer(self, new_capacity: int):
         """Expand buffer capacity while preserving order."""
-        new_buffer = [None] * new_capacity
+        if self._overwrite:
+            self._rebuild_deque(new_capacity)
+            return
+        
+        new_buffer = [None] * _storage_size(new_capacity)
         
         # Copy existing messages in order
-        for i in range(self._size):
-            old_index = (self._tail + i) % self._capacity
-            new_buffer[i] = self._buffer[old_index]
+        self._copy_ordered(new_buffer, self._tail, self._size)
         
         self._buffer = new_buffer
+        self._mask = len(new_buffer) - 1
         self._tail = 0
-        self._head = self._size
+        self._head = self._size & self._mask
         self._capacity = new_capacity
     
     def _shrink_buffer(self, new_capacity: int):
         """Shrink buffer capacity without data loss."""
-        new_buffer = [None] * new_capacity
+        if self._overwrite:
+            self._rebuild_deque(new_capacity)
+            return
+        
+        new_buffer = [None] * _storage_size(new_capacity)
         
         # Copy all existing messages
-        for i in range(self._size):
-            old_index = (self._tail + i) % self._capacity
-            new_buffer[i] = self._buffer[old_index]
+        self._copy_ordered(new_buffer, self._tail, self._size)
         
         self._buffer = new_buffer
+        self._mask = len(new_buffer) - 1
         self._tail = 0
-        self._head = self._size
+        self._head = self._size & self._mask
         self._capacity = new_capacity
     
     def _shrink_with_data_loss(self, new_capacity: int):
-        """Shrink buffer capacity, discarding oldest messages."""
-        new_buffer = [None] * new_capacity
-        
-        # Calculate how many messages to keep (newest ones)
-        messages_to_discard = self._size - new_capacity
-        
-        # Copy only the newest messages
-        for i in range(new_capacity):
-            old_index = (self._tail + messages_to_discard + i) % self._capacity
-            new_buffer[i] = self._buffer[old_index]
-        
-        self._buffer = new_buffer
-        self._tail = 0
-        self._head = new_capacity
-        self._size = new_capacity
+        """Shrink buffer capacity, discarding oldest messages (overwrite mode only)."""
+        self._rebuild_deque(new_capacity)
+    
+    def _rebuild_deque(self, new_capacity: int):
+        """Replace the overwrite-mode deque; a shorter maxlen keeps the newest messages."""
+        self._buffer = deque(self._buffer, maxlen=new_capacity)
+        self._size = len(self._buffer)
         self._capacity = new_capacity
     
+    def _copy_ordered(self, new_buffer: list, start: int, count: int):
+        """
+        Copy count messages beginning at ring index start into the front
+        of new_buffer, unwrapping the ring with at most two slice copies.
+        """
+        buf = self._buffer
+        end = start + count
+        storage = len(buf)
+        if end <= storage:
+            new_buffer[:count] = buf[start:end]
+        else:
+            first = storage - start
+            new_buffer[:first] = buf[start:]
+            new_buffer[first:count] = buf[:count - first]
+    
     def get_size(self) -> int:
         """Return current number of messages in buffer."""
         return self._size
@@ -216,9 +566,7 @@ class CyclicBuffer:
     
     def clear_flags(self):
         """Clear all status flags."""
-        self._overflow_flag = False
-        self._underflow_flag = False
-        self._data_loss_resize_flag = False
+        self._flags = 0
     
     def get_overflow_flag(self) -> bool:
         """
@@ -227,9 +575,9 @@ class CyclicBuffer:
         Returns:
             True if overflow occurred since last check
         """
-        flag = self._overflow_flag
-        self._overflow_flag = False
-        return flag
+        flags = self._flags
+        self._flags = flags & ~_OVERFLOW
+        return bool(flags & _OVERFLOW)
     
     def get_underflow_flag(self) -> bool:
         """
@@ -238,9 +586,9 @@ class CyclicBuffer:
         Returns:
             True if underflow occurred since last check
         """
-        flag = self._underflow_flag
-        self._underflow_flag = False
-        return flag
+        flags = self._flags
+        self._flags = flags & ~_UNDERFLOW
+        return bool(flags & _UNDERFLOW)
     
     def get_data_loss_resize_flag(self) -> bool:
         """
@@ -249,9 +597,32 @@ class CyclicBuffer:
         Returns:
             True if data was lost during resize since last check
         """
-        flag = self._data_loss_resize_flag
-        self._data_loss_resize_flag = False
-        return flag
+        flags = self._flags
+        self._flags = flags & ~_DATA_LOSS_RESIZE
+        return bool(flags & _DATA_LOSS_RESIZE)
+    
+    def peek_overflow_flag(self) -> bool:
+        """Return overflow flag without clearing it."""
+        return bool(self._flags & _OVERFLOW)
+    
+    def peek_underflow_flag(self) -> bool:
+        """Return underflow flag without clearing it."""
+        return bool(self._flags & _UNDERFLOW)
+    
+    def peek_data_loss_resize_flag(self) -> bool:
+        """Return data loss resize flag without clearing it."""
+        return bool(self._flags & _DATA_LOSS_RESIZE)
+    
+    def snapshot_flags(self) -> Tuple[bool, bool, bool]:
+        """
+        Get and clear all status flags in one call.
+        
+        Returns:
+            (overflow, underflow, data_loss_resize) as of the last check
+        """
+        flags = self._flags
+        self._flags = 0
+        return bool(flags & _OVERFLOW), bool(flags & _UNDERFLOW), bool(flags & _DATA_LOSS_RESIZE)
     
     def __str__(self):
         """String representation of buffer state."""
@@ -261,3 +632,119 @@ class CyclicBuffer:
     def __len__(self):
         """Return current size (enables len(buffer))."""
         return self._size
+
+
+class SPSCCyclicBuffer:
+    """
+    Lock-free single-producer/single-consumer circular buffer (Lamport queue).
+    
+    One thread may call push() while another calls pop() without a Lock.
+    head is a free-running counter written only by the producer, tail one
+    written only by the consumer; each side reads the other's counter to
+    detect full/empty and publishes its own after touching the slot. This
+    relies on the GIL making single attribute loads/stores atomic and
+    ordered, so it is not safe on free-threaded builds.
+    
+    There is no overwrite mode and no resize: both would require the
+    producer to move tail.
+    """
+    
+    __slots__ = (
+        "_capacity", "_buffer", "_mask", "_head", "_tail",
+        "_overflow_flag", "_underflow_flag",
+    )
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize SPSC buffer.
+        
+        Args:
+            capacity: Maximum number of messages (1-100)
+            
+        Raises:
+            ValueError: If capacity < 1 or capacity > 100
+        """
+        if not (1 <= capacity <= 100):
+            raise ValueError(f"Capacity must be between 1 and 100, got {capacity}")
+        
+        self._capacity = capacity
+        self._buffer = [None] * _storage_size(capacity)
+        self._mask = len(self._buffer) - 1
+        self._head = 0  # Messages pushed so far (producer-owned)
+        self._tail = 0  # Messages popped so far (consumer-owned)
+        
+        # Status flags: each written by a different thread, so not packed
+        # into one int like CyclicBuffer._flags (that would race)
+        self._overflow_flag = False
+        self._underflow_flag = False
+    
+    def push(self, message: Message) -> bool:
+        """
+        Add message to buffer (producer thread only).
+        
+        Raises:
+            BufferOverflowError: If buffer is full
+        """
+        head = self._head
+        if head - self._tail == self._capacity:
+            self._overflow_flag = True
+            raise BufferOverflowError("Buffer is full")
+        
+        self._buffer[head & self._mask] = message
+        self._head = head + 1  # Publish after the slot is written
+        return True
+    
+    def pop(self) -> Message:
+        """
+        Remove and return oldest message (consumer thread only).
+        
+        Raises:
+            BufferUnderflowError: If buffer is empty
+        """
+        tail = self._tail
+        if tail == self._head:
+            self._underflow_flag = True
+            raise BufferUnderflowError("Buffer is empty")
+        
+        index = tail & self._mask
+        buf = self._buffer
+        message = buf[index]
+        buf[index] = None  # Clear reference
+        self._tail = tail + 1  # Release the slot to the producer
+        return message
+    
+    def get_size(self) -> int:
+        """Return current number of messages (a snapshot under concurrency)."""
+        return self._head - self._tail
+    
+    def get_max_size(self) -> int:
+        """Return maximum capacity of buffer."""
+        return self._capacity
+    
+    def is_empty(self) -> bool:
+        """Check if buffer is empty."""
+        return self._head == self._tail
+    
+    def is_full(self) -> bool:
+        """Check if buffer is full."""
+        return self._head - self._tail == self._capacity
+    
+    def get_overflow_flag(self) -> bool:
+        """Get and clear overflow flag (producer thread only)."""
+        flag = self._overflow_flag
+        self._overflow_flag = False
+        return flag
+    
+    def get_underflow_flag(self) -> bool:
+        """Get and clear underflow flag (consumer thread only)."""
+        flag = self._underflow_flag
+        self._underflow_flag = False
+        return flag
+    
+    def __str__(self):
+        """String representation of buffer state."""
+        return f"SPSCCyclicBuffer(size={self.get_size()}/{self._capacity})"
+    
+    def __len__(self):
+        """Return current size (enables len(buffer))."""
+        return self.get_size()
@@ -8,7 +8,26 @@ from abc import ABC, abstractmethod
 
 
 class Message(ABC):
-    """Abstract base class for all message types."""
+    """
+    Abstract base class for all message types.
+    
+    Every subclass gets its own free-list (_POOL, created in
+    __init_subclass__) of released instances that acquire() reuses instead
+    of allocating a new object per parse.
+    
+    The hierarchy is flat: TelemetryMessage, LocationMessage and
+    SettingsMessage are leaves that are not subclassed further, so
+    type(msg) is an exact message-type check (tests rely on this).
+    """
+    
+    _POOL_LIMIT = 100  # Matches the maximum buffer capacity
+    _TYPE = None  # Message type string set by acquire(); leaf classes override it
+    _pooled = False  # True while the instance sits in its class pool
+    
+    def __init_subclass__(cls, **kwargs):
+        """Give every subclass its own free-list, so pools never mix classes."""
+        super().__init_subclass__(**kwargs)
+        cls._POOL = []
     
     def __init__(self, sensor_id: int, msg_type: str):
         """
@@ -24,6 +43,76 @@ class Message(ABC):
         self.sensor_id = sensor_id
         self.msg_type = msg_type
     
+    @classmethod
+    def acquire(cls, sensor_id: int) -> "Message":
+        """
+        Return a reset instance from the class pool, or a new one if empty.
+        
+        Range validation is skipped, so sensor_id must already be validated
+        (MessageFactory guarantees 000-999).
+        
+        Args:
+            sensor_id: Sensor ID (0-999)
+        """
+        try:
+            message = cls._POOL.pop()
+        except IndexError:  # Pool empty (or drained by another thread)
+            return cls._unchecked(sensor_id)
+        message._pooled = False
+        message.sensor_id = sensor_id
+        message._reset_fields()
+        return message
+    
+    @classmethod
+    def parse(cls, sensor_id: int, data: str) -> "Message":
+        """
+        Acquire a pooled instance and fill it from a data payload.
+        
+        Args:
+            sensor_id: Sensor ID (0-999), already validated
+            data: Message-specific data payload
+            
+        Returns:
+            Parsed message
+            
+        Raises:
+            ValueError: If data is invalid (the instance goes back to the pool)
+        """
+        message = cls.acquire(sensor_id)
+        try:
+            message.parse_data(data)
+        except ValueError:
+            message.release()
+            raise
+        return message
+    
+    @classmethod
+    def _unchecked(cls, sensor_id: int) -> "Message":
+        """Create an instance without re-validating an already validated sensor_id."""
+        message = cls.__new__(cls)
+        message.sensor_id = sensor_id
+        message.msg_type = cls._TYPE
+        message._reset_fields()
+        return message
+    
+    def release(self):
+        """
+        Return message to its class pool; it must not be used afterwards.
+        
+        Releasing an instance that is already pooled is a no-op, so it can
+        never be handed out twice by acquire().
+        """
+        if self._pooled:
+            return
+        pool = type(self)._POOL
+        if len(pool) < self._POOL_LIMIT:
+            self._pooled = True
+            pool.append(self)
+    
+    def _reset_fields(self):
+        """Clear message-specific data fields (pooled subclasses override this)."""
+        pass
+    
     @abstractmethod
     def parse_data(self, data: str):
         """Parse message-specific data payload."""
@@ -37,23 +126,42 @@ class Message(ABC):
 class TelemetryMessage(Message):
     """Telemetry message containing battery status."""
     
+    _TYPE = "TEL"
+    
     def __init__(self, sensor_id: int):
-        super().__init__(sensor_id, "TEL")
+        super().__init__(sensor_id, self._TYPE)
+        self._reset_fields()
+    
+    def _reset_fields(self):
         self.battery_status = None
     
-    def parse_data(self, data: str):
+    @staticmethod
+    def parse_fields(data: str) -> tuple:
         """
-        Parse battery status from data.
+        Validate telemetry data without creating a message.
         
         Args:
             data: String containing battery percentage
+            
+        Returns:
+            (battery_status,)
         """
         try:
-            self.battery_status = int(data)
-            if not (0 <= self.battery_status <= 100):
-                raise ValueError(f"Battery status must be between 0 and 100, got {self.battery_status}")
+            battery_status = int(data)
+            if not (0 <= battery_status <= 100):
+                raise ValueError(f"Battery status must be between 0 and 100, got {battery_status}")
         except ValueError as e:
             raise ValueError(f"Invalid telemetry data format: {e}")
+        return (battery_status,)
+    
+    def parse_data(self, data: str):
+        """
+        Parse battery status from data.
+        
+        Args:
+            data: String containing battery percentage
+        """
+        (self.battery_status,) = self.parse_fields(data)
     
     def __str__(self):
         return f"TelemetryMessage(sensor_id={self.sensor_id}, battery={self.battery_status}%)"
@@ -62,34 +170,53 @@ class TelemetryMessage(Message):
 class LocationMessage(Message):
     """Location message containing GPS coordinates."""
     
+    _TYPE = "GPS"
+    
     def __init__(self, sensor_id: int):
-        super().__init__(sensor_id, "GPS")
+        super().__init__(sensor_id, self._TYPE)
+        self._reset_fields()
+    
+    def _reset_fields(self):
         self.longitude = None
         self.latitude = None
     
-    def parse_data(self, data: str):
+    @staticmethod
+    def parse_fields(data: str) -> tuple:
         """
-        Parse longitude and latitude from data.
+        Validate GPS data without creating a message.
         
         Args:
             data: String containing "longitude,latitude"
+            
+        Returns:
+            (longitude, latitude)
         """
         try:
-            parts = data.split(',')
-            if len(parts) != 2:
+            lon_str, sep, lat_str = data.partition(',')
+            if not sep:
                 raise ValueError("GPS data must contain exactly 2 comma-separated values")
             
-            self.longitude = float(parts[0])
-            self.latitude = float(parts[1])
+            longitude = float(lon_str)
+            latitude = float(lat_str)  # Rejects any further comma
             
             # Validate ranges
-            if not (-180 <= self.longitude <= 180):
-                raise ValueError(f"Longitude must be between -180 and 180, got {self.longitude}")
-            if not (-90 <= self.latitude <= 90):
-                raise ValueError(f"Latitude must be between -90 and 90, got {self.latitude}")
+            if not (-180 <= longitude <= 180):
+                raise ValueError(f"Longitude must be between -180 and 180, got {longitude}")
+            if not (-90 <= latitude <= 90):
+                raise ValueError(f"Latitude must be between -90 and 90, got {latitude}")
             
-        except (ValueError, IndexError) as e:
+        except ValueError as e:
             raise ValueError(f"Invalid GPS data format: {e}")
+        return longitude, latitude
+    
+    def parse_data(self, data: str):
+        """
+        Parse longitude and latitude from data.
+        
+        Args:
+            data: String containing "longitude,latitude"
+        """
+        self.longitude, self.latitude = self.parse_fields(data)
     
     def __str__(self):
         return f"LocationMessage(sensor_id={self.sensor_id}, lon={self.longitude}, lat={self.latitude})"
@@ -98,34 +225,52 @@ class LocationMessage(Message):
 class SettingsMessage(Message):
     """Settings message containing on/off state and message rate."""
     
+    _TYPE = "SET"
+    
     def __init__(self, sensor_id: int):
-        super().__init__(sensor_id, "SET")
+        super().__init__(sensor_id, self._TYPE)
+        self._reset_fields()
+    
+    def _reset_fields(self):
         self.on_off = None
         self.msgs_per_second = None
     
-    def parse_data(self, data: str):
+    @staticmethod
+    def parse_fields(data: str) -> tuple:
         """
-        Parse settings from data.
+        Validate settings data without creating a message.
         
         Args:
             data: String containing "on_off,msgs_per_second"
+            
+        Returns:
+            (on_off, msgs_per_second)
         """
         try:
-            parts = data.split(',')
-            if len(parts) != 2:
+            on_off_str, sep, rate_str = data.partition(',')
+            if not sep:
                 raise ValueError("Settings data must contain exactly 2 comma-separated values")
             
-            on_off_val = int(parts[0])
+            on_off_val = int(on_off_str)
             if on_off_val not in (0, 1):
                 raise ValueError(f"on_off must be 0 or 1, got {on_off_val}")
-            self.on_off = bool(on_off_val)
             
-            self.msgs_per_second = int(parts[1])
-            if not (0 <= self.msgs_per_second <= 1000):
-                raise ValueError(f"msgs_per_second must be between 0 and 1000, got {self.msgs_per_second}")
+            msgs_per_second = int(rate_str)  # Rejects any further comma
+            if not (0 <= msgs_per_second <= 1000):
+                raise ValueError(f"msgs_per_second must be between 0 and 1000, got {msgs_per_second}")
             
-        except (ValueError, IndexError) as e:
+        except ValueError as e:
             raise ValueError(f"Invalid settings data format: {e}")
+        return bool(on_off_val), msgs_per_second
+    
+    def parse_data(self, data: str):
+        """
+        Parse settings from data.
+        
+        Args:
+            data: String containing "on_off,msgs_per_second"
+        """
+        self.on_off, self.msgs_per_second = self.parse_fields(data)
     
     def __str__(self):
         return f"SettingsMessage(sensor_id={self.sensor_id}, on={self.on_off}, rate={self.msgs_per_second})"
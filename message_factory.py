@@ -3,9 +3,14 @@
 """
 Factory for creating Message objects from string input.
 """
+import re
 from message import Message, TelemetryMessage, LocationMessage, SettingsMessage
 
 
+# sss (3-digit sensor ID), mmm (message type), ddd... (data payload)
+_HEADER_RE = re.compile(r"(\d{3})(.{3})(.*)", re.DOTALL)
+
+
 class InvalidMessageError(Exception):
     """Exception raised for unrecognized or malformed messages."""
     pass
@@ -20,6 +25,34 @@ class MessageFactory:
         "SET": SettingsMessage
     }
     
+    @staticmethod
+    def split_message(msg_string: str) -> tuple:
+        """
+        Split a message string into its header fields and data payload.
+        
+        Args:
+            msg_string: Fixed-format message string
+            
+        Returns:
+            (sensor_id, msg_type, data); msg_type is not validated
+            
+        Raises:
+            InvalidMessageError: If message is too short or sensor ID is malformed
+        """
+        # Split sensor ID, message type and data payload in one C-level match
+        match = _HEADER_RE.match(msg_string)
+        if match is None:
+            if len(msg_string) < 6:
+                raise InvalidMessageError(
+                    f"Message too short. Expected at least 6 characters, got {len(msg_string)}"
+                )
+            raise InvalidMessageError(
+                f"Invalid sensor ID format: '{msg_string[0:3]}'. Must be 3-digit number (000-999)"
+            )
+        
+        sensor_id_str, msg_type, data = match.groups()
+        return int(sensor_id_str), msg_type, data  # Three digits, always within 000-999
+    
     @staticmethod
     def create_message(msg_string: str) -> Message:
         """
@@ -39,46 +72,75 @@ class MessageFactory:
         Raises:
             InvalidMessageError: If message format is invalid
         """
-        # Validate minimum length
-        if len(msg_string) < 6:
-            raise InvalidMessageError(
-                f"Message too short. Expected at least 6 characters, got {len(msg_string)}"
-            )
+        # Common case: one C-level match, one dict lookup, one parser call
+        match = _MSG_RE.match(msg_string)
+        if match is None:
+            return MessageFactory._create_message_slow(msg_string)
         
-        # Extract sensor ID (first 3 characters)
-        sensor_id_str = msg_string[0:3]
+        sensor_id_str, msg_type, data = match.groups()
         try:
-            sensor_id = int(sensor_id_str)
-            if not (0 <= sensor_id <= 999):
-                raise ValueError()
-        except ValueError:
-            raise InvalidMessageError(
-                f"Invalid sensor ID format: '{sensor_id_str}'. Must be 3-digit number (000-999)"
-            )
-        
-        # Extract message type (characters 3-5, 0-indexed)
-        msg_type = msg_string[3:6]
-        
-        # Validate message type
-        if msg_type not in MessageFactory.MESSAGE_TYPES:
-            raise InvalidMessageError(
-                f"Unknown message type: '{msg_type}'. Must be one of: GPS, TEL, SET"
-            )
-        
-        # Extract data payload (everything after position 6)
-        data = msg_string[6:]
+            return _DISPATCH[msg_type](int(sensor_id_str), data)
+        except ValueError as e:
+            raise InvalidMessageError(f"Failed to parse {msg_type} message data: {e}")
+    
+    @staticmethod
+    def _create_message_slow(msg_string: str) -> Message:
+        """
+        Handle messages that did not match _MSG_RE.
         
-        # Create appropriate message object
-        message_class = MessageFactory.MESSAGE_TYPES[msg_type]
-        message = message_class(sensor_id)
+        That is either a malformed message, or one whose type was added to
+        MESSAGE_TYPES after import and so is missing from the fast-path tables.
         
-        # Parse data payload
+        Raises:
+            InvalidMessageError: If message format is invalid
+        """
+        sensor_id, msg_type, data = MessageFactory.split_message(msg_string)
+        message_class = MessageFactory.MESSAGE_TYPES.get(msg_type)
+        if message_class is None:
+            raise MessageFactory._unknown_type_error(msg_type)
+        if data == "":
+            raise InvalidMessageError(f"Failed to parse {msg_type} message data: empty payload")
         try:
-            message.parse_data(data)
+            return message_class.parse(sensor_id, data)
         except ValueError as e:
             raise InvalidMessageError(f"Failed to parse {msg_type} message data: {e}")
+    
+    @staticmethod
+    def _unknown_type_error(msg_type: str) -> InvalidMessageError:
+        """Build the error for a message type missing from MESSAGE_TYPES."""
+        return InvalidMessageError(
+            f"Unknown message type: '{msg_type}'. "
+            f"Must be one of: {', '.join(MessageFactory.MESSAGE_TYPES)}"
+        )
+    
+    @staticmethod
+    def create_message_bytes(msg_bytes: bytes) -> Message:
+        """
+        Create a Message from raw bytes (e.g. read from a socket or file).
         
-        return message
+        Args:
+            msg_bytes: Fixed-format ASCII message
+            
+        Returns:
+            Appropriate Message subclass instance
+            
+        Raises:
+            InvalidMessageError: If message is not ASCII or its format is invalid
+        """
+        try:
+            msg_string = msg_bytes.decode("ascii")
+        except UnicodeDecodeError as e:
+            raise InvalidMessageError(f"Message must be ASCII: {e}")
+        return MessageFactory.create_message(msg_string)
+
+
+# Fast-path tables derived from the MESSAGE_TYPES registry:
+# a well-formed header with a known type and a non-empty payload,
+# and message type -> parser taking (sensor_id, data)
+_MSG_RE = re.compile(
+    r"(\d{3})(%s)(.+)" % "|".join(map(re.escape, MessageFactory.MESSAGE_TYPES)), re.DOTALL
+)
+_DISPATCH = {msg_type: cls.parse for msg_type, cls in MessageFactory.MESSAGE_TYPES.items()}
 
 
 def create_message_from_string(msg_string: str) -> Message:
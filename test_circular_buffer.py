@@ -1,10 +1,74 @@
 """
+PYTEST_DONT_REWRITE
+
 Comprehensive test suite for Circular Buffer implementation.
+
+The marker above opts this module out of pytest's assertion rewriting, so
+failing asserts report a plain AssertionError. Remove it temporarily when a
+failure needs pytest's detailed assertion output.
 """
+import threading
+import time
+import weakref
+from functools import lru_cache
 import pytest
-from cyclic_buffer import CyclicBuffer, BufferOverflowError, BufferUnderflowError
+from cyclic_buffer import CyclicBuffer, SPSCCyclicBuffer, BufferOverflowError, BufferUnderflowError
 from message_factory import MessageFactory, InvalidMessageError
-from message import TelemetryMessage, LocationMessage, SettingsMessage
+from message import Message, TelemetryMessage, LocationMessage, SettingsMessage
+
+
+# Raw messages fed through a 2-slot ring by test_multiple_wrap_cycles
+WRAP_INPUTS = tuple(f"{i:03d}TEL{i*10}" for i in range(10))
+
+
+@lru_cache(maxsize=None)
+def _mk(raw):
+    """Parse each distinct literal once; buffer tests only push/pop by reference."""
+    return MessageFactory.create_message(raw)
+
+
+@pytest.fixture(autouse=True)
+def _empty_message_pools():
+    """Start and end every test with empty message pools."""
+    pools = (TelemetryMessage._POOL, LocationMessage._POOL, SettingsMessage._POOL)
+    for pool in pools:
+        pool.clear()
+    yield
+    for pool in pools:
+        pool.clear()
+
+
+@pytest.fixture(scope="module")
+def buf_factory():
+    """Return get(capacity, overwrite=False) handing out cleared, reused buffers."""
+    cache = {}
+    def get(capacity, overwrite=False):
+        key = (capacity, overwrite)
+        buffer = cache.get(key)
+        if buffer is None or buffer.get_max_size() != capacity:  # Rebuild after resize()
+            cache[key] = buffer = CyclicBuffer(capacity=capacity, overwrite=overwrite)
+        buffer.clear()
+        return buffer
+    return get
+
+
+@pytest.fixture(scope="module")
+def _one_slot_buffer():
+    """Capacity-1 buffer built once over a preallocated 1-slot list."""
+    return CyclicBuffer.from_prealloc([None], 1)
+
+
+@pytest.fixture
+def one_slot(_one_slot_buffer):
+    """Cleared capacity-1 buffer (overwrite disabled) shared across tests."""
+    _one_slot_buffer.clear()
+    return _one_slot_buffer
+
+
+@pytest.fixture(scope="module")
+def msgs():
+    """Pre-parsed telemetry messages; msgs[i] has sensor_id i."""
+    return tuple(MessageFactory.create_message(f"{i:03d}TEL{(i % 10) * 10}") for i in range(16))
 
 
 class TestMessageParsing:
@@ -12,28 +76,24 @@ class TestMessageParsing:
     
     def test_valid_telemetry_message(self):
         msg = MessageFactory.create_message("042TEL85")
-        assert isinstance(msg, TelemetryMessage)
+        assert type(msg) is TelemetryMessage
         assert msg.sensor_id == 42
         assert msg.battery_status == 85
     
     def test_valid_gps_message(self):
         msg = MessageFactory.create_message("001GPS-73.994454,40.750042")
-        assert isinstance(msg, LocationMessage)
+        assert type(msg) is LocationMessage
         assert msg.sensor_id == 1
         assert msg.longitude == -73.994454
         assert msg.latitude == 40.750042
     
     def test_valid_settings_message(self):
         msg = MessageFactory.create_message("123SET1,10")
-        assert isinstance(msg, SettingsMessage)
+        assert type(msg) is SettingsMessage
         assert msg.sensor_id == 123
         assert msg.on_off is True
         assert msg.msgs_per_second == 10
     
-    def test_invalid_sensor_id_format(self):
-        with pytest.raises(InvalidMessageError):
-            MessageFactory.create_message("ABCGPS1.0,2.0")
-    
     def test_invalid_sensor_id_range(self):
         # 999 is valid (max value)
         msg = MessageFactory.create_message("999GPS1.0,2.0")
@@ -42,33 +102,40 @@ class TestMessageParsing:
         # Sensor IDs can't exceed 999 due to 3-char format
         # Test would require 4+ chars which fails at parsing stage
     
-    def test_invalid_message_type(self):
-        with pytest.raises(InvalidMessageError):
-            MessageFactory.create_message("001XYZ123")
-    
-    def test_message_too_short(self):
-        with pytest.raises(InvalidMessageError):
-            MessageFactory.create_message("001GP")
-    
-    def test_telemetry_invalid_battery_range(self):
-        with pytest.raises(InvalidMessageError):
-            MessageFactory.create_message("001TEL101")
-        with pytest.raises(InvalidMessageError):
-            MessageFactory.create_message("001TEL-1")
-    
-    def test_gps_invalid_coordinate_range(self):
-        with pytest.raises(InvalidMessageError):
-            MessageFactory.create_message("001GPS-200.0,40.0")  # Invalid longitude
-        with pytest.raises(InvalidMessageError):
-            MessageFactory.create_message("001GPS-73.0,100.0")  # Invalid latitude
+    def test_type_registered_after_import(self, monkeypatch):
+        monkeypatch.setitem(MessageFactory.MESSAGE_TYPES, "TLM", TelemetryMessage)
+        
+        msg = MessageFactory.create_message("001TLM10")
+        assert (type(msg), msg.sensor_id, msg.battery_status) == (TelemetryMessage, 1, 10)
+        with pytest.raises(InvalidMessageError, match="empty payload"):
+            MessageFactory.create_message("001TLM")
+        with pytest.raises(InvalidMessageError, match="Battery"):
+            MessageFactory.create_message("001TLM101")
     
-    def test_settings_invalid_on_off(self):
+    def test_create_message_from_bytes(self):
+        msg = MessageFactory.create_message_bytes(b"001GPS-73.994454,40.750042")
+        assert type(msg) is LocationMessage
+        assert (msg.sensor_id, msg.longitude, msg.latitude) == (1, -73.994454, 40.750042)
+        
         with pytest.raises(InvalidMessageError):
-            MessageFactory.create_message("001SET2,10")  # on_off must be 0 or 1
-    
-    def test_settings_invalid_rate_range(self):
+            MessageFactory.create_message_bytes(b"001TEL\xff")
+    
+    @pytest.mark.parametrize("raw", [
+        "ABCGPS1.0,2.0",                            # Non-numeric sensor ID
+        " 01TEL85", "+01TEL85", "-01TEL85",         # Sensor ID not 3 digits
+        "001XYZ123",                                # Unknown message type
+        "001GP",                                    # Too short
+        "001TEL",                                   # Empty data payload
+        "001TEL101", "001TEL-1",                    # Battery out of range
+        "001GPS-200.0,40.0", "001GPS-73.0,100.0",   # Longitude / latitude out of range
+        "001SET2,10",                               # on_off must be 0 or 1
+        "001SET1,1001",                             # Rate out of range
+        "001GPS1.0", "001GPS1.0,2.0,3.0",           # Wrong GPS field count
+        "001SET1", "001SET1,10,5",                  # Wrong settings field count
+    ])
+    def test_invalid_messages(self, raw):
         with pytest.raises(InvalidMessageError):
-            MessageFactory.create_message("001SET1,1001")
+            MessageFactory.create_message(raw)
 
 
 class TestBasicBufferOperations:
@@ -81,9 +148,9 @@ class TestBasicBufferOperations:
         assert buffer.is_empty()
         assert not buffer.is_full()
     
-    def test_push_and_pop_single_message(self):
-        buffer = CyclicBuffer(capacity=3)
-        msg = MessageFactory.create_message("001TEL50")
+    def test_push_and_pop_single_message(self, buf_factory, msgs):
+        buffer = buf_factory(3)
+        msg = msgs[1]
         
         buffer.push(msg)
         assert buffer.get_size() == 1
@@ -94,74 +161,84 @@ class TestBasicBufferOperations:
         assert buffer.get_size() == 0
         assert buffer.is_empty()
     
-    def test_fifo_ordering(self):
-        buffer = CyclicBuffer(capacity=5)
+    def test_fifo_ordering(self, buf_factory, msgs):
+        buffer = buf_factory(5)
         
         # Push multiple messages
-        msg1 = MessageFactory.create_message("001TEL10")
-        msg2 = MessageFactory.create_message("002TEL20")
-        msg3 = MessageFactory.create_message("003TEL30")
-        
-        buffer.push(msg1)
-        buffer.push(msg2)
-        buffer.push(msg3)
+        buffer.push_many(msgs[1:4])
         
         # Pop in FIFO order
-        assert buffer.pop().sensor_id == 1
-        assert buffer.pop().sensor_id == 2
-        assert buffer.pop().sensor_id == 3
+        assert [m.sensor_id for m in buffer.pop_many(3)] == [1, 2, 3]
     
-    def test_mixed_message_types(self):
-        buffer = CyclicBuffer(capacity=5)
+    @pytest.mark.parametrize("overwrite", [False, True])
+    def test_clear(self, msgs, overwrite):
+        buffer = CyclicBuffer(capacity=3, overwrite=overwrite)
+        buffer.push(msgs[1])
+        buffer.push(msgs[2])
+        buffer.pop()
+        buffer.pop()
+        with pytest.raises(BufferUnderflowError):
+            buffer.pop()
+        buffer.push(msgs[3])
         
-        buffer.push(MessageFactory.create_message("001GPS-73.0,40.0"))
-        buffer.push(MessageFactory.create_message("002TEL75"))
-        buffer.push(MessageFactory.create_message("003SET1,100"))
+        buffer.clear()
+        assert buffer.is_empty()
+        assert buffer.get_max_size() == 3
+        assert not buffer.peek_underflow_flag()
+        
+        # Storage is reused and FIFO order starts over
+        buffer.push(msgs[4])
+        assert buffer.pop().sensor_id == 4
+    
+    def test_mixed_message_types(self, buf_factory):
+        buffer = buf_factory(5)
+        
+        buffer.push(_mk("001GPS-73.0,40.0"))
+        buffer.push(_mk("002TEL75"))
+        buffer.push(_mk("003SET1,100"))
         
         msg1 = buffer.pop()
         msg2 = buffer.pop()
         msg3 = buffer.pop()
         
-        assert isinstance(msg1, LocationMessage)
-        assert isinstance(msg2, TelemetryMessage)
-        assert isinstance(msg3, SettingsMessage)
+        assert type(msg1) is LocationMessage
+        assert type(msg2) is TelemetryMessage
+        assert type(msg3) is SettingsMessage
 
 
 class TestBufferOverflow:
     """Test buffer overflow conditions."""
     
-    def test_overflow_without_overwrite_raises_exception(self):
-        buffer = CyclicBuffer(capacity=2, overwrite=False)
+    def test_overflow_without_overwrite_raises_exception(self, buf_factory, msgs):
+        buffer = buf_factory(2)
         
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
+        buffer.push(msgs[1])
+        buffer.push(msgs[2])
         
         assert buffer.is_full()
         
         with pytest.raises(BufferOverflowError):
-            buffer.push(MessageFactory.create_message("003TEL30"))
+            buffer.push(msgs[3])
     
-    def test_overflow_flag_set_on_overflow(self):
-        buffer = CyclicBuffer(capacity=2, overwrite=False)
+    def test_overflow_flag_set_on_overflow(self, buf_factory, msgs):
+        buffer = buf_factory(2)
         
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
+        buffer.push(msgs[1])
+        buffer.push(msgs[2])
         
-        try:
-            buffer.push(MessageFactory.create_message("003TEL30"))
-        except BufferOverflowError:
-            pass
+        assert buffer.try_push(msgs[3]) is False
+        assert buffer.get_size() == 2
         
         assert buffer.get_overflow_flag() is True
         # Flag should be cleared after reading
         assert buffer.get_overflow_flag() is False
     
-    def test_overflow_with_overwrite_replaces_oldest(self):
-        buffer = CyclicBuffer(capacity=2, overwrite=True)
+    def test_overflow_with_overwrite_replaces_oldest(self, buf_factory, msgs):
+        buffer = buf_factory(2, overwrite=True)
         
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
-        buffer.push(MessageFactory.create_message("003TEL30"))  # Should overwrite first
+        buffer.push(msgs[1])
+        buffer.push(msgs[2])
+        buffer.push(msgs[3])  # Should overwrite first
         
         assert buffer.get_size() == 2
         
@@ -170,32 +247,61 @@ class TestBufferOverflow:
         assert msg1.sensor_id == 2
         msg2 = buffer.pop()
         assert msg2.sensor_id == 3
+    
+    def test_overwrite_logs_only_at_debug(self, buf_factory, caplog, msgs):
+        buffer = buf_factory(1, overwrite=True)
+        buffer.push(msgs[1])
+        
+        with caplog.at_level("WARNING", logger="cyclic_buffer"):
+            buffer.push(msgs[2])
+        assert caplog.records == []
+        
+        with caplog.at_level("DEBUG", logger="cyclic_buffer"):
+            buffer.push(msgs[3])
+        assert [r.levelname for r in caplog.records] == ["DEBUG"]
+    
+    def test_overwrite_releases_discarded_message(self, buf_factory):
+        buffer = buf_factory(3, overwrite=True)
+        oldest = MessageFactory.create_message("001TEL10")
+        ref = weakref.ref(oldest)
+        
+        buffer.push(oldest)
+        del oldest
+        for i in range(2, 5):
+            buffer.push(MessageFactory.create_message(f"{i:03d}TEL{i*10}"))
+        
+        # Overwritten message must not linger in the buffer
+        assert ref() is None
 
 
 class TestBufferUnderflow:
     """Test buffer underflow conditions."""
     
-    def test_underflow_raises_exception(self):
-        buffer = CyclicBuffer(capacity=3)
+    def test_underflow_raises_exception(self, buf_factory):
+        buffer = buf_factory(3)
         
         with pytest.raises(BufferUnderflowError):
             buffer.pop()
     
-    def test_underflow_flag_set(self):
-        buffer = CyclicBuffer(capacity=3)
+    def test_underflow_flag_set(self, buf_factory):
+        buffer = buf_factory(3)
         
-        try:
-            buffer.pop()
-        except BufferUnderflowError:
-            pass
+        assert buffer.try_pop() == (False, None)
         
         assert buffer.get_underflow_flag() is True
         assert buffer.get_underflow_flag() is False  # Cleared after reading
     
-    def test_underflow_after_emptying_buffer(self):
-        buffer = CyclicBuffer(capacity=3)
+    def test_try_push_and_try_pop_succeed(self, one_slot, msgs):
+        buffer = one_slot
         
-        buffer.push(MessageFactory.create_message("001TEL10"))
+        assert buffer.try_push(msgs[1]) is True
+        assert buffer.try_pop() == (True, msgs[1])
+        assert buffer.snapshot_flags() == (False, False, False)
+    
+    def test_underflow_after_emptying_buffer(self, buf_factory, msgs):
+        buffer = buf_factory(3)
+        
+        buffer.push(msgs[1])
         buffer.pop()
         
         with pytest.raises(BufferUnderflowError):
@@ -205,168 +311,395 @@ class TestBufferUnderflow:
 class TestBufferResize:
     """Test dynamic buffer resizing."""
     
-    def test_resize_increase_capacity(self):
-        buffer = CyclicBuffer(capacity=3)
-        
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
-        
-        assert buffer.resize(5) is True
-        assert buffer.get_max_size() == 5
-        assert buffer.get_size() == 2
+    @pytest.mark.parametrize("cap,ow,n,new,ok,size,ids,loss", [
+        (3, False, 2, 5, True, 2, [1, 2], False),      # Grow
+        (5, False, 2, 3, True, 2, [1, 2], False),      # Shrink, everything fits
+        (5, True, 4, 2, True, 2, [3, 4], True),        # Shrink with overwrite drops oldest
+        (5, False, 3, 2, False, 3, [1, 2, 3], False),  # Shrink without overwrite is rejected
+        (3, False, 3, 5, True, 3, [1, 2, 3], False),   # Grow a full buffer, FIFO order kept
+    ])
+    def test_resize_transitions(self, buf_factory, msgs, cap, ow, n, new, ok, size, ids, loss):
+        buffer = buf_factory(cap, overwrite=ow)
+        buffer.push_many(msgs[1:n + 1])
         
-        # Original messages should be preserved
-        assert buffer.pop().sensor_id == 1
-        assert buffer.pop().sensor_id == 2
+        assert buffer.resize(new) is ok
+        assert buffer.get_max_size() == (new if ok else cap)
+        assert buffer.get_size() == size
+        assert buffer.peek_data_loss_resize_flag() is loss
+        assert [m.sensor_id for m in buffer.pop_many(size)] == ids
     
-    def test_resize_decrease_no_data_loss(self):
-        buffer = CyclicBuffer(capacity=5)
+    def test_resize_data_loss_logs_discarded_count(self, buf_factory, caplog, msgs):
+        buffer = buf_factory(5, overwrite=True)
         
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
+        for i in range(1, 5):
+            buffer.push(msgs[i])
         
-        assert buffer.resize(3) is True
-        assert buffer.get_max_size() == 3
-        assert buffer.get_size() == 2
+        with caplog.at_level("WARNING", logger="cyclic_buffer"):
+            buffer.resize(1)
         
-        # Messages preserved
-        assert buffer.pop().sensor_id == 1
-        assert buffer.pop().sensor_id == 2
+        assert "Discarded 3 messages" in caplog.text
     
-    def test_resize_decrease_with_data_loss_overwrite_true(self):
-        buffer = CyclicBuffer(capacity=5, overwrite=True)
-        
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
-        buffer.push(MessageFactory.create_message("003TEL30"))
-        buffer.push(MessageFactory.create_message("004TEL40"))
+    def test_resize_invalid_capacity(self, buf_factory):
+        buffer = buf_factory(5)
         
-        assert buffer.resize(2) is True
-        assert buffer.get_max_size() == 2
-        assert buffer.get_size() == 2
-        
-        # Oldest messages discarded, newest kept
-        assert buffer.pop().sensor_id == 3
-        assert buffer.pop().sensor_id == 4
+        with pytest.raises(ValueError):
+            buffer.resize(0)
         
-        assert buffer.get_data_loss_resize_flag() is True
+        with pytest.raises(ValueError):
+            buffer.resize(101)
     
-    def test_resize_decrease_rejected_overwrite_false(self):
-        buffer = CyclicBuffer(capacity=5, overwrite=False)
+    def test_push_after_resize_to_full(self, buf_factory, msgs):
+        buffer = buf_factory(5)
         
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
-        buffer.push(MessageFactory.create_message("003TEL30"))
+        for i in range(1, 5):
+            buffer.push(msgs[i])
         
-        # Should reject resize
-        assert buffer.resize(2) is False
-        assert buffer.get_max_size() == 5  # Capacity unchanged
-        assert buffer.get_size() == 3  # Data unchanged
+        # Shrink to a power-of-two capacity that is exactly full
+        buffer.resize(4)
+        buffer.pop()
+        buffer.push(msgs[5])
+        
+        assert [buffer.pop().sensor_id for _ in range(4)] == [2, 3, 4, 5]
     
-    def test_resize_invalid_capacity(self):
-        buffer = CyclicBuffer(capacity=5)
+    def test_overwrite_push_after_resize_to_full(self, buf_factory, msgs):
+        buffer = buf_factory(5, overwrite=True)
         
-        with pytest.raises(ValueError):
-            buffer.resize(0)
+        for i in range(1, 5):
+            buffer.push(msgs[i])
         
-        with pytest.raises(ValueError):
-            buffer.resize(101)
+        buffer.resize(4)
+        buffer.push(msgs[5])
+        
+        assert [buffer.pop().sensor_id for _ in range(4)] == [2, 3, 4, 5]
     
-    def test_resize_preserves_fifo_order(self):
-        buffer = CyclicBuffer(capacity=3)
+    def test_resize_wrapped_ring(self, buf_factory, msgs):
+        buffer = buf_factory(4)
         
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
-        buffer.push(MessageFactory.create_message("003TEL30"))
+        for i in range(1, 5):
+            buffer.push(msgs[i])
+        buffer.pop()
+        buffer.pop()
+        buffer.push(msgs[5])
+        buffer.push(msgs[6])  # Wraps around
         
-        buffer.resize(5)
+        assert buffer.resize(8) is True
+        buffer.pop()
+        assert buffer.resize(3) is True
         
-        # Order should be preserved
-        assert buffer.pop().sensor_id == 1
-        assert buffer.pop().sensor_id == 2
-        assert buffer.pop().sensor_id == 3
+        assert [buffer.pop().sensor_id for _ in range(3)] == [4, 5, 6]
 
 
 class TestCircularBehavior:
     """Test circular wrapping behavior."""
     
-    def test_circular_wrap_around(self):
-        buffer = CyclicBuffer(capacity=3)
+    def test_circular_wrap_around(self, buf_factory, msgs):
+        buffer = buf_factory(3)
         
         # Fill buffer
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
-        buffer.push(MessageFactory.create_message("003TEL30"))
+        buffer.push_many(msgs[1:4])
         
         # Pop one
         buffer.pop()
         
         # Push another (should wrap)
-        buffer.push(MessageFactory.create_message("004TEL40"))
+        buffer.push(msgs[4])
         
         assert buffer.get_size() == 3
         
         # Check FIFO order
-        assert buffer.pop().sensor_id == 2
-        assert buffer.pop().sensor_id == 3
-        assert buffer.pop().sensor_id == 4
+        assert [m.sensor_id for m in buffer.pop_many(3)] == [2, 3, 4]
     
-    def test_multiple_wrap_cycles(self):
-        buffer = CyclicBuffer(capacity=2, overwrite=True)
+    def test_multiple_wrap_cycles(self, buf_factory):
+        buffer = buf_factory(2, overwrite=True)
+        push, pop = buffer.push, buffer.pop
+        prepared = [_mk(raw) for raw in WRAP_INPUTS]
         
-        for i in range(10):
-            buffer.push(MessageFactory.create_message(f"{i:03d}TEL{i*10}"))
+        for i, m in enumerate(prepared):
+            push(m)
             if i >= 2:  # Start popping after buffer has 2 items
-                buffer.pop()
+                pop()
         
-        assert buffer.get_size() == 2
+        # The push at i=2 overwrites, so each later push/pop pair leaves one message
+        assert buffer.get_size() == 1
+        assert buffer.pop().sensor_id == 9
+
+
+class TestBulkOperations:
+    """Test batched push_many/pop_many operations."""
+    
+    def test_push_many_and_pop_many_preserve_order(self, buf_factory, msgs):
+        buffer = buf_factory(5)
+        buffer.push(msgs[1])
+        buffer.pop()  # Offset head so the batch wraps
+        
+        messages = [msgs[i] for i in range(2, 7)]
+        assert buffer.push_many(messages) == 5
+        assert buffer.is_full()
+        
+        assert [m.sensor_id for m in buffer.pop_many(3)] == [2, 3, 4]
+        assert [m.sensor_id for m in buffer.pop_many(2)] == [5, 6]
+        assert buffer.is_empty()
+    
+    def test_push_many_overflow_leaves_buffer_unchanged(self, buf_factory, msgs):
+        buffer = buf_factory(3)
+        buffer.push(msgs[1])
+        
+        messages = [msgs[i] for i in range(2, 5)]
+        with pytest.raises(BufferOverflowError):
+            buffer.push_many(messages)
+        
+        assert buffer.peek_overflow_flag() is True
+        assert buffer.get_size() == 1
+        assert buffer.pop().sensor_id == 1
+    
+    def test_push_many_overwrite_keeps_newest(self, buf_factory, msgs):
+        buffer = buf_factory(3, overwrite=True)
+        buffer.push(msgs[1])
+        buffer.push(msgs[2])
+        
+        buffer.push_many(msgs[i] for i in range(3, 5))
+        assert [m.sensor_id for m in buffer.pop_many(3)] == [2, 3, 4]
+        
+        buffer.push_many([msgs[i] for i in range(5, 10)])
+        assert [m.sensor_id for m in buffer.pop_many(3)] == [7, 8, 9]
+        assert buffer.peek_overflow_flag() is True
+    
+    def test_peek_view_and_advance(self, buf_factory, msgs):
+        buffer = buf_factory(4)
+        for i in range(1, 5):
+            buffer.push(msgs[i])
+        buffer.pop()
+        buffer.push(msgs[5])  # Wraps around
+        
+        views = buffer.peek_view()
+        assert len(views) == 2
+        assert [m.sensor_id for part in views for m in part] == [2, 3, 4, 5]
+        assert buffer.get_size() == 4  # Peeking does not consume
+        
+        assert [m.sensor_id for part in buffer.peek_view(2) for m in part] == [2, 3]
+        buffer.advance(2)
+        assert [m.sensor_id for m in buffer.pop_many(2)] == [4, 5]
+        
+        with pytest.raises(BufferUnderflowError):
+            buffer.advance(1)
+    
+    def test_peek_view_and_advance_overwrite(self, buf_factory, msgs):
+        buffer = buf_factory(2, overwrite=True)
+        for i in range(1, 4):
+            buffer.push(msgs[i])
+        
+        assert [m.sensor_id for part in buffer.peek_view() for m in part] == [2, 3]
+        buffer.advance(1)
+        assert buffer.pop().sensor_id == 3
+    
+    @pytest.mark.parametrize("overwrite", [False, True])
+    def test_peek_view_rejects_negative_count(self, buf_factory, msgs, overwrite):
+        buffer = buf_factory(4, overwrite=overwrite)
+        buffer.push(msgs[1])
+        
+        with pytest.raises(ValueError, match="non-negative"):
+            buffer.peek_view(-1)
+        assert buffer.peek_view(0) == ([],)
+    
+    def test_pusher_and_popper(self, buf_factory, msgs):
+        buffer = buf_factory(3)
+        push, pop = buffer.pusher(), buffer.popper()
+        
+        for i in range(1, 4):
+            push(msgs[i])
+        
+        assert [pop().sensor_id for _ in range(3)] == [1, 2, 3]
+    
+    def test_pop_many_underflow_leaves_buffer_unchanged(self, buf_factory, msgs):
+        buffer = buf_factory(3)
+        buffer.push(msgs[1])
+        
+        with pytest.raises(BufferUnderflowError):
+            buffer.pop_many(2)
+        
+        assert buffer.peek_underflow_flag() is True
+        assert buffer.get_size() == 1
+
+
+class TestMessagePooling:
+    """Test message reuse through per-class pools."""
+    
+    def test_released_message_is_reused_and_reset(self):
+        msg = MessageFactory.create_message("001TEL10")
+        msg.release()
+        
+        reused = MessageFactory.create_message("002TEL20")
+        assert reused is msg
+        assert reused.sensor_id == 2
+        assert reused.battery_status == 20
+        assert TelemetryMessage._POOL == []
+    
+    def test_double_release_is_ignored(self):
+        msg = MessageFactory.create_message("001TEL10")
+        msg.release()
+        msg.release()
+        
+        first = MessageFactory.create_message("002TEL20")
+        second = MessageFactory.create_message("003TEL30")
+        assert first is msg
+        assert second is not first
+        assert (first.sensor_id, second.sensor_id) == (2, 3)
+        
+        # Once handed out again the instance can be released again
+        first.release()
+        assert TelemetryMessage._POOL == [first]
+    
+    def test_subclass_without_reset_fields(self):
+        class PingMessage(Message):
+            def parse_data(self, data):
+                pass
+        
+        assert PingMessage(7, "PNG").sensor_id == 7
+    
+    def test_custom_subclass_release_and_pop_and_release(self, buf_factory):
+        class PingMessage(Message):
+            _TYPE = "PNG"
+            
+            def parse_data(self, data):
+                pass
+        
+        msg = PingMessage(7, "PNG")
+        buffer = buf_factory(2)
+        buffer.push(msg)
+        
+        assert buffer.pop_and_release(lambda m: m.sensor_id) == 7
+        assert PingMessage._POOL == [msg]
+        assert TelemetryMessage._POOL == []
+        
+        reused = PingMessage.acquire(8)
+        assert reused is msg and reused.sensor_id == 8
+        assert PingMessage.acquire(9).msg_type == "PNG"  # Pool empty: fresh instance
+        msg.release()
+        msg.release()
+        assert PingMessage._POOL == [msg]
+    
+    def test_failed_parse_returns_message_to_pool(self):
+        with pytest.raises(InvalidMessageError):
+            MessageFactory.create_message("001SET2,10")
+        
+        assert len(SettingsMessage._POOL) == 1
+        assert SettingsMessage._POOL[0].on_off is None
+    
+    def test_pop_and_release(self, buf_factory):
+        buffer = buf_factory(2)
+        msg = MessageFactory.create_message("001GPS1.0,2.0")
+        buffer.push(msg)
+        
+        assert buffer.pop_and_release(lambda m: m.longitude) == 1.0
+        assert buffer.is_empty()
+        assert LocationMessage._POOL == [msg]
+
+
+class TestSPSCBuffer:
+    """Test the lock-free single-producer/single-consumer buffer."""
+    
+    def test_fifo_overflow_and_underflow(self, msgs):
+        buffer = SPSCCyclicBuffer(capacity=3)
+        for i in range(1, 4):
+            buffer.push(msgs[i])
+        
+        assert buffer.is_full()
+        with pytest.raises(BufferOverflowError):
+            buffer.push(msgs[4])
+        assert buffer.get_overflow_flag() is True
+        
+        assert [buffer.pop().sensor_id for _ in range(3)] == [1, 2, 3]
+        with pytest.raises(BufferUnderflowError):
+            buffer.pop()
+        assert buffer.get_underflow_flag() is True
+    
+    def test_threaded_producer_consumer(self):
+        buffer = SPSCCyclicBuffer(capacity=4)
+        messages = [MessageFactory.create_message(f"{i % 1000:03d}TEL{i % 101}") for i in range(2000)]
+        received = []
+        
+        def produce():
+            for message in messages:
+                while True:
+                    try:
+                        buffer.push(message)
+                        break
+                    except BufferOverflowError:
+                        time.sleep(0)  # Yield to the consumer
+        
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while len(received) < len(messages):
+            try:
+                received.append(buffer.pop())
+            except BufferUnderflowError:
+                time.sleep(0)  # Yield to the producer
+        producer.join()
+        
+        assert received == messages
+        assert buffer.is_empty()
 
 
 class TestFlagManagement:
     """Test flag clearing and sticky behavior."""
     
-    def test_clear_flags_clears_all(self):
-        buffer = CyclicBuffer(capacity=2, overwrite=True)
+    def test_clear_flags_clears_all(self, buf_factory, msgs):
+        buffer = buf_factory(2, overwrite=True)
         
         # Trigger overflow
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
-        buffer.push(MessageFactory.create_message("003TEL30"))
+        buffer.push(msgs[1])
+        buffer.push(msgs[2])
+        buffer.push(msgs[3])
         
         # Trigger underflow
         buffer.pop()
         buffer.pop()
-        try:
-            buffer.pop()
-        except BufferUnderflowError:
-            pass
+        assert buffer.try_pop() == (False, None)
         
         # Trigger data loss resize
-        buffer.push(MessageFactory.create_message("004TEL40"))
-        buffer.push(MessageFactory.create_message("005TEL50"))
+        buffer.push(msgs[4])
+        buffer.push(msgs[5])
         buffer.resize(1)
         
         buffer.clear_flags()
         
-        assert buffer.get_overflow_flag() is False
-        assert buffer.get_underflow_flag() is False
-        assert buffer.get_data_loss_resize_flag() is False
+        of, uf, dl = buffer.snapshot_flags()
+        assert not (of or uf or dl)
     
-    def test_flags_sticky_until_read(self):
-        buffer = CyclicBuffer(capacity=2, overwrite=False)
+    def test_snapshot_flags_reads_and_clears_all(self, buf_factory, msgs):
+        buffer = buf_factory(2, overwrite=True)
+        
+        buffer.push(msgs[1])
+        buffer.push(msgs[2])
+        buffer.push(msgs[3])  # Overflow
+        buffer.resize(1)      # Data loss
         
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
+        assert buffer.snapshot_flags() == (True, False, True)
+        assert buffer.snapshot_flags() == (False, False, False)
+    
+    def test_peek_flags_do_not_clear(self, one_slot):
+        buffer = one_slot
+        buffer.try_pop()
+        
+        assert buffer.peek_underflow_flag() is True
+        assert buffer.peek_underflow_flag() is True
+        assert buffer.peek_overflow_flag() is False
+        assert buffer.peek_data_loss_resize_flag() is False
+        assert buffer.get_underflow_flag() is True
+        assert buffer.peek_underflow_flag() is False
+    
+    def test_flags_sticky_until_read(self, buf_factory, msgs):
+        buffer = buf_factory(2)
+        
+        buffer.push(msgs[1])
+        buffer.push(msgs[2])
         
         # Trigger overflow
-        try:
-            buffer.push(MessageFactory.create_message("003TEL30"))
-        except BufferOverflowError:
-            pass
+        assert not buffer.try_push(msgs[3])
         
         # Multiple operations shouldn't clear flag
         buffer.pop()
-        buffer.push(MessageFactory.create_message("004TEL40"))
+        buffer.push(msgs[4])
         
         # Flag should still be set
         assert buffer.get_overflow_flag() is True
@@ -377,55 +710,54 @@ class TestFlagManagement:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
     
-    def test_capacity_one_buffer(self):
-        buffer = CyclicBuffer(capacity=1)
+    def test_capacity_one_buffer(self, one_slot, msgs):
+        buffer = one_slot
         
-        buffer.push(MessageFactory.create_message("001TEL10"))
+        buffer.push(msgs[1])
         assert buffer.is_full()
         
         msg = buffer.pop()
         assert msg.sensor_id == 1
         assert buffer.is_empty()
     
-    def test_capacity_one_with_overwrite(self):
-        buffer = CyclicBuffer(capacity=1, overwrite=True)
+    def test_capacity_one_with_overwrite(self, buf_factory, msgs):
+        buffer = buf_factory(1, overwrite=True)
         
-        buffer.push(MessageFactory.create_message("001TEL10"))
-        buffer.push(MessageFactory.create_message("002TEL20"))
+        buffer.push(msgs[1])
+        buffer.push(msgs[2])
         
         msg = buffer.pop()
         assert msg.sensor_id == 2  # First was overwritten
     
-    def test_sensor_id_edge_cases(self):
-        # Test boundary sensor IDs
-        msg1 = MessageFactory.create_message("000TEL10")
-        assert msg1.sensor_id == 0
-        
-        msg2 = MessageFactory.create_message("999TEL20")
-        assert msg2.sensor_id == 999
-    
-    def test_gps_coordinate_boundaries(self):
-        msg1 = MessageFactory.create_message("001GPS-180.0,-90.0")
-        assert msg1.longitude == -180.0
-        assert msg1.latitude == -90.0
-        
-        msg2 = MessageFactory.create_message("001GPS180.0,90.0")
-        assert msg2.longitude == 180.0
-        assert msg2.latitude == 90.0
-    
-    def test_settings_rate_boundaries(self):
-        msg1 = MessageFactory.create_message("001SET0,0")
-        assert msg1.on_off is False
-        assert msg1.msgs_per_second == 0
+    def test_from_prealloc_adopts_storage(self, msgs):
+        storage = [msgs[0]] * 4
+        buffer = CyclicBuffer.from_prealloc(storage, 3)
         
-        msg2 = MessageFactory.create_message("001SET1,1000")
-        assert msg2.on_off is True
-        assert msg2.msgs_per_second == 1000
+        assert buffer.is_empty()
+        assert storage == [None] * 4
+        buffer.push_many(msgs[1:4])
+        assert storage[:3] == list(msgs[1:4])
+        with pytest.raises(BufferOverflowError):
+            buffer.push(msgs[4])
     
-    def test_empty_data_payload(self):
-        # Should fail - data required
-        with pytest.raises(InvalidMessageError):
-            MessageFactory.create_message("001TEL")
+    @pytest.mark.parametrize("length,capacity", [(2, 3), (3, 3), (4, 0), (128, 101)])
+    def test_from_prealloc_invalid(self, length, capacity):
+        with pytest.raises(ValueError):
+            CyclicBuffer.from_prealloc([None] * length, capacity)
+    
+    @pytest.mark.parametrize("raw,expected", [
+        ("000TEL10", {"sensor_id": 0}),
+        ("999TEL20", {"sensor_id": 999}),
+        ("001GPS-180.0,-90.0", {"longitude": -180.0, "latitude": -90.0}),
+        ("001GPS180.0,90.0", {"longitude": 180.0, "latitude": 90.0}),
+        ("001SET0,0", {"on_off": False, "msgs_per_second": 0}),
+        ("001SET1,1000", {"on_off": True, "msgs_per_second": 1000}),
+    ])
+    def test_boundaries(self, raw, expected):
+        msg = MessageFactory.create_message(raw)
+        # Compare (value, type) pairs so 0/1 cannot stand in for False/True
+        actual = {name: (getattr(msg, name), type(getattr(msg, name))) for name in expected}
+        assert actual == {name: (value, type(value)) for name, value in expected.items()}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+"""
+Test suite for the columnar (structure-of-arrays) circular buffer.
+"""
+import pytest
+from columnar_buffer import ColumnarCyclicBuffer, TYPE_CODES
+from cyclic_buffer import BufferOverflowError, BufferUnderflowError
+from message_factory import MessageFactory, InvalidMessageError
+from message import Message, TelemetryMessage, LocationMessage, SettingsMessage
+
+
+class TestColumnarBuffer:
+    """Test parsing into columns and materializing messages."""
+    
+    def test_push_parsed_and_pop_round_trip(self):
+        buffer = ColumnarCyclicBuffer(capacity=3)
+        
+        buffer.push_parsed("001GPS-73.994454,40.750042")
+        buffer.push_parsed("002TEL85")
+        buffer.push_parsed("003SET1,10")
+        assert buffer.is_full()
+        
+        gps = buffer.pop()
+        assert isinstance(gps, LocationMessage)
+        assert (gps.sensor_id, gps.longitude, gps.latitude) == (1, -73.994454, 40.750042)
+        
+        tel = buffer.pop()
+        assert isinstance(tel, TelemetryMessage)
+        assert (tel.sensor_id, tel.battery_status) == (2, 85)
+        
+        settings = buffer.pop()
+        assert isinstance(settings, SettingsMessage)
+        assert (settings.sensor_id, settings.on_off, settings.msgs_per_second) == (3, True, 10)
+        assert buffer.is_empty()
+    
+    def test_view_returns_live_rows_in_order(self):
+        buffer = ColumnarCyclicBuffer(capacity=4)
+        
+        for raw in ("001TEL10", "002TEL20", "003GPS1.0,2.0", "004TEL40"):
+            buffer.push_parsed(raw)
+        buffer.pop()
+        buffer.pop()
+        buffer.push_parsed("005TEL50")  # Live rows now wrap around
+        
+        assert buffer.view("sensor_id").tolist() == [3, 4, 5]
+        assert buffer.view("type").tolist() == [TYPE_CODES["GPS"], TYPE_CODES["TEL"], TYPE_CODES["TEL"]]
+        assert buffer.view("battery").tolist() == [0, 40, 50]
+    
+    def test_view_wraps_as_numpy_array(self):
+        np = pytest.importorskip("numpy")
+        buffer = ColumnarCyclicBuffer(capacity=4)
+        
+        for raw in ("001TEL10", "002TEL20", "003GPS1.0,2.0", "004TEL40"):
+            buffer.push_parsed(raw)
+        buffer.pop()
+        
+        types = np.asarray(buffer.view("type"))
+        battery = np.asarray(buffer.view("battery"))
+        assert np.mean(battery[types == TYPE_CODES["TEL"]]) == 30
+    
+    def test_view_is_read_only(self):
+        buffer = ColumnarCyclicBuffer(capacity=2)
+        buffer.push_parsed("001TEL10")
+        
+        with pytest.raises(TypeError):
+            buffer.view("battery")[0] = 99
+    
+    def test_overflow_and_underflow(self):
+        buffer = ColumnarCyclicBuffer(capacity=1)
+        buffer.push_parsed("001TEL10")
+        
+        with pytest.raises(BufferOverflowError):
+            buffer.push_parsed("002TEL20")
+        
+        buffer.pop()
+        with pytest.raises(BufferUnderflowError):
+            buffer.pop()
+    
+    def test_overwrite_discards_oldest_row(self):
+        buffer = ColumnarCyclicBuffer(capacity=2, overwrite=True)
+        
+        for raw in ("001TEL10", "002TEL20", "003TEL30"):
+            buffer.push_parsed(raw)
+        
+        assert buffer.view("sensor_id").tolist() == [2, 3]
+    
+    def test_invalid_message_leaves_buffer_unchanged(self):
+        buffer = ColumnarCyclicBuffer(capacity=2)
+        
+        with pytest.raises(InvalidMessageError):
+            buffer.push_parsed("001TEL101")
+        
+        assert buffer.is_empty()
+    
+    def test_message_types_come_from_factory_registry(self, monkeypatch):
+        class PingMessage(Message):
+            _TYPE = "PNG"
+            
+            @staticmethod
+            def parse_fields(data):
+                return ()
+            
+            def parse_data(self, data):
+                pass
+        
+        monkeypatch.setitem(MessageFactory.MESSAGE_TYPES, "TLM", TelemetryMessage)
+        monkeypatch.setitem(MessageFactory.MESSAGE_TYPES, "PNG", PingMessage)
+        buffer = ColumnarCyclicBuffer(capacity=2)
+        
+        buffer.push_parsed("001TLM10")  # Alias of a supported class
+        assert buffer.view("type").tolist() == [TYPE_CODES["TEL"]]
+        with pytest.raises(InvalidMessageError, match="not supported"):
+            buffer.push_parsed("002PNG1")
+        with pytest.raises(InvalidMessageError, match="Unknown message type"):
+            buffer.push_parsed("003XYZ1")
+        assert buffer.get_size() == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])